@@ -1,83 +1,160 @@
+import os
 import mlflow
 import mlflow.sklearn
+import numpy as np
 import pandas as pd
+import joblib
+from joblib import Memory
 from sklearn.model_selection import train_test_split
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.metrics import accuracy_score, precision_score, recall_score, confusion_matrix
-import matplotlib.pyplot as plt
-import seaborn as sns
+from sklearn.ensemble import HistGradientBoostingClassifier
+from sklearn.metrics import confusion_matrix
 
 # --- CONFIGURATION ---
 TRACKING_URI = "http://localhost:5000" 
 EXPERIMENT_NAME = "Pokemon_Legendary_Predictor"
+# Set MAKE_PLOT=1 to also render and log the confusion matrix as a PNG
+PLOT = os.getenv("MAKE_PLOT") == "1"
 
 mlflow.set_tracking_uri(TRACKING_URI)
 mlflow.set_experiment(EXPERIMENT_NAME)
 
+# Autolog records params, training metrics, the model and its signature on fit
+mlflow.sklearn.autolog(log_models=True, log_input_examples=False, log_model_signatures=True)
+
 # --- DATA ---
 url = "https://gist.githubusercontent.com/armgilles/194bcff35001e7eb53a2a8b441e8b2c6/raw/92200bc0a673d5ce2110aaad4544ed6c4010f687/pokemon.csv"
-df = pd.read_csv(url)
+POKEDEX_CACHE = "pokemon.parquet"
+RAW_COLUMNS = ['Name', 'HP', 'Attack', 'Defense', 'Sp. Atk', 'Sp. Def', 'Speed', 'Generation', 'Legendary']
+NUMERIC_COLUMNS = ['HP', 'Attack', 'Defense', 'Sp. Atk', 'Sp. Def', 'Speed', 'Generation']
+CSV_CHUNKSIZE = 100_000
+
+def fetch_pokedex():
+    # Download the CSV once and keep a local Parquet copy for later runs.
+    # usecols drops the unused columns and the float32 stats halve the numeric
+    # block; the chunks are still concatenated, so the pruned table is held in full.
+    if not os.path.exists(POKEDEX_CACHE):
+        reader = pd.read_csv(
+            url,
+            usecols=RAW_COLUMNS,
+            dtype={col: np.float32 for col in NUMERIC_COLUMNS},
+            chunksize=CSV_CHUNKSIZE,
+        )
+        pd.concat(reader, ignore_index=True).to_parquet(POKEDEX_CACHE, engine='pyarrow')
+    return POKEDEX_CACHE
 
 # 1. FEATURE ENGINEERING: Calculate "Total Stats"
 # This gives the model a clear summary of power
-df['Total_Stats'] = df['HP'] + df['Attack'] + df['Defense'] + df['Sp. Atk'] + df['Sp. Def'] + df['Speed']
+STAT_COLS = ['HP', 'Attack', 'Defense', 'Sp. Atk', 'Sp. Def', 'Speed']
+# Below this many rows NumPy's row sum beats importing and running the Numba kernel
+NUMBA_MIN_ROWS = 5_000_000
 
 features = ['HP', 'Attack', 'Defense', 'Sp. Atk', 'Sp. Def', 'Speed', 'Generation', 'Total_Stats']
 target = 'Legendary'
 
-X = df[features]
-y = df[target]
+# The split is memoized on disk; later runs memory-map the arrays read-only
+# instead of rebuilding them. joblib only hashes make_split's arguments and its
+# own source, so everything it reads is passed in: the Parquet file's mtime and
+# size, the column lists, and a version number. Bump SPLIT_CACHE_VERSION (or
+# delete .cache/) when code make_split calls, such as total_stats, changes.
+SPLIT_CACHE_VERSION = 1
+memory = Memory(".cache", mmap_mode='r', verbose=0)
+
+@memory.cache
+def make_split(pokedex_path, pokedex_mtime, pokedex_size, raw_columns, stat_cols, features, target, version):
+    df = pd.read_parquet(pokedex_path, engine='pyarrow', columns=raw_columns)
+    stats = df[stat_cols].to_numpy()
+    if len(stats) >= NUMBA_MIN_ROWS:
+        from _kernels import total_stats
+        df['Total_Stats'] = total_stats(stats)
+    else:
+        df['Total_Stats'] = stats.sum(axis=1, dtype=np.result_type(stats.dtype, np.int32))
+    # float32 keeps the cached arrays small; HistGradientBoostingClassifier still
+    # converts X to float64 in fit, so training itself makes a full-size copy
+    X = df[features].to_numpy(dtype=np.float32)
+    y = df[target].to_numpy(dtype=np.uint8)
+    names = df['Name'].to_numpy()
+    index = df.index.to_numpy()
+    return train_test_split(X, y, names, index, test_size=0.2, random_state=42)
 
-X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+pokedex_path = fetch_pokedex()
+pokedex_stat = os.stat(pokedex_path)
+(X_train, X_test, y_train, y_test,
+ names_train, names_test, index_train, index_test) = make_split(
+    pokedex_path, pokedex_stat.st_mtime_ns, pokedex_stat.st_size,
+    RAW_COLUMNS, STAT_COLS, features, target, SPLIT_CACHE_VERSION
+)
+# Wrapping keeps the feature names (and Pokedex row labels) without copying the arrays
+X_train = pd.DataFrame(X_train, columns=features, index=index_train, copy=False)
+X_test = pd.DataFrame(X_test, columns=features, index=index_test, copy=False)
+
+# Keep the held-out rows (with names) next to the model for Pokemon_detective.py
+TEST_SET_PATH = "test_set.parquet"
+MODEL_PATH = "my_model.pkl"
+X_test.assign(Name=names_test, Actual=y_test).to_parquet(TEST_SET_PATH)
 
 # --- TRAIN ---
 with mlflow.start_run(run_name="Legendary_Hunter_v3_Engineered"):
     
-    n_estimators = 100
+    # Autolog does not know which columns were used, so record them explicitly
+    mlflow.log_param("features_used", str(features))
+    
+    max_iter = 100
     max_depth = 15
     
-    mlflow.log_param("n_estimators", n_estimators)
-    mlflow.log_param("max_depth", max_depth)
-    mlflow.log_param("features_used", str(features))
-    mlflow.log_param("class_weight", "balanced") # Log this new change
-
     print("Training model with Total Stats + Balanced Weights...")
     
     # 2. MODEL TWEAK: class_weight='balanced'
-    # This forces the model to care more about the rare "Legendary" class
-    clf = RandomForestClassifier(
-        n_estimators=n_estimators, 
+    # This forces the model to care more about the rare "Legendary" class.
+    # Histogram-based boosting bins the stats up front, so it stays fast as the Pokedex grows.
+    clf = HistGradientBoostingClassifier(
+        max_iter=max_iter, 
         max_depth=max_depth, 
         random_state=42,
-        class_weight='balanced' 
+        class_weight='balanced'
     )
     clf.fit(X_train, y_train)
 
     y_pred = clf.predict(X_test)
     
-    acc = accuracy_score(y_test, y_pred)
-    prec = precision_score(y_test, y_pred)
-    recall = recall_score(y_test, y_pred)
+    # One pass over the predictions: derive every metric from the confusion matrix
+    cm = confusion_matrix(y_test, y_pred, labels=[0, 1])
+    tn, fp, fn, tp = cm.ravel()
+    acc = float((tp + tn) / cm.sum())
+    prec = float(tp / (tp + fp)) if tp + fp else 0.0
+    recall = float(tp / (tp + fn)) if tp + fn else 0.0
     
     print(f"Accuracy: {acc:.4f} | Precision: {prec:.4f} | Recall: {recall:.4f}")
     
-    mlflow.log_metric("accuracy", acc)
-    mlflow.log_metric("precision", prec)
-    mlflow.log_metric("recall", recall)
-
-    # Confusion Matrix
-    cm = confusion_matrix(y_test, y_pred)
-    plt.figure(figsize=(6,6))
-    sns.heatmap(cm, annot=True, fmt='d', cmap='Blues', 
-                xticklabels=['Normal', 'Legendary'], 
-                yticklabels=['Normal', 'Legendary'])
-    plt.ylabel('Actual')
-    plt.xlabel('Predicted')
-    plt.title('Legendary Prediction (v3 Balanced)')
-    
-    plt.savefig("confusion_matrix_v3.png")
-    mlflow.log_artifact("confusion_matrix_v3.png")
+    # Autolog only sees sklearn metric functions, so the test metrics derived
+    # from the confusion matrix are logged by hand
+    mlflow.log_metrics({"accuracy": acc, "precision": prec, "recall": recall})
+
+    # Confusion Matrix: the four counts are always logged as JSON; the PNG is opt-in
+    mlflow.log_dict({"tn": int(tn), "fp": int(fp), "fn": int(fn), "tp": int(tp)}, "confusion_matrix_v3.json")
+
+    if PLOT:
+        import matplotlib.pyplot as plt
+
+        labels = ['Normal', 'Legendary']
+        fig, ax = plt.subplots(figsize=(6,6))
+        im = ax.imshow(cm, cmap='Blues')
+        fig.colorbar(im, ax=ax)
+        # White text on dark cells, black on light ones, as seaborn's annotations did
+        threshold = cm.max() / 2
+        for i in range(cm.shape[0]):
+            for j in range(cm.shape[1]):
+                color = 'white' if cm[i, j] > threshold else 'black'
+                ax.text(j, i, cm[i, j], ha='center', va='center', color=color)
+        ax.set_xticks([0, 1], labels)
+        ax.set_yticks([0, 1], labels)
+        ax.set_ylabel('Actual')
+        ax.set_xlabel('Predicted')
+        ax.set_title('Legendary Prediction (v3 Balanced)')
+        
+        mlflow.log_figure(fig, "confusion_matrix_v3.png")
+        plt.close(fig)
 
-    mlflow.sklearn.log_model(clf, "model", input_example=X_train.iloc[:5])
+    # Local compressed copy for Pokemon_detective.py
+    joblib.dump(clf, MODEL_PATH, compress=('lz4', 3))
 
     print("Run v3 Complete! Check MLflow UI.")
\ No newline at end of file
@@ -0,0 +1,19 @@
+"""
+Shared data loading for the iris examples.
+
+load_iris() re-parses sklearn's bundled CSV on every call, so the result is
+cached on disk with joblib (shared across the example scripts) and in memory
+for repeated calls within one process.
+"""
+
+import functools
+from joblib import Memory
+from sklearn.datasets import load_iris
+
+memory = Memory(".cache", verbose=0)
+
+
+@functools.lru_cache(maxsize=None)
+def get_iris():
+    """Return the iris Bunch, loading it from the on-disk cache after the first run."""
+    return memory.cache(load_iris)()
@@ -7,8 +7,9 @@ Uses local storage backend.
 
 import mlflow
 import mlflow.sklearn
+import numpy as np
 import pandas as pd
-from sklearn.datasets import load_iris
+from _data import get_iris
 from sklearn.model_selection import train_test_split
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.metrics import accuracy_score, precision_score, recall_score
@@ -29,10 +30,13 @@ os.environ['MLFLOW_TRACKING_URI'] = 'http://localhost:5000'
 # Delete old experiments or use a new name to get HTTP-based artifact serving
 mlflow.set_experiment("iris_classification_demo")
 
+# Autolog records params, training metrics, the model and its signature on fit
+mlflow.sklearn.autolog(log_models=True, log_input_examples=False, log_model_signatures=True)
+
 # Load data
-iris = load_iris()
-X = pd.DataFrame(iris.data, columns=iris.feature_names)
-y = iris.target
+iris = get_iris()
+X = pd.DataFrame(iris.data, columns=iris.feature_names).astype(np.float32)
+y = iris.target.astype(np.uint8)
 
 # Split data
 X_train, X_test, y_train, y_test = train_test_split(
@@ -46,39 +50,23 @@ with mlflow.start_run(run_name="rf_classifier_v1"):
     max_depth = 10
     random_state = 42
     
-    # Log parameters
-    mlflow.log_param("n_estimators", n_estimators)
-    mlflow.log_param("max_depth", max_depth)
-    mlflow.log_param("random_state", random_state)
-    
     # Train model
     model = RandomForestClassifier(
         n_estimators=n_estimators,
         max_depth=max_depth,
-        random_state=random_state
+        random_state=random_state,
+        n_jobs=-1
     )
     model.fit(X_train, y_train)
     
     # Make predictions
     y_pred = model.predict(X_test)
     
-    # Calculate metrics
+    # Calculate metrics (autolog records these against X_test as well)
     accuracy = accuracy_score(y_test, y_pred)
     precision = precision_score(y_test, y_pred, average='weighted')
     recall = recall_score(y_test, y_pred, average='weighted')
     
-    # Log metrics
-    mlflow.log_metric("accuracy", accuracy)
-    mlflow.log_metric("precision", precision)
-    mlflow.log_metric("recall", recall)
-    
-    # Log model with input example to auto-infer signature
-    mlflow.sklearn.log_model(
-        model, 
-        "model",
-        input_example=X_test.iloc[:5]  # Use first 5 test samples as input example
-    )
-    
     # Log additional artifacts (optional)
     mlflow.log_text(f"Training completed successfully", "training_log.txt")
     
@@ -7,7 +7,8 @@ Uses local storage backend.
 
 import mlflow
 import mlflow.sklearn
-from sklearn.datasets import load_iris
+import numpy as np
+from _data import get_iris
 from sklearn.model_selection import train_test_split
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.metrics import accuracy_score
@@ -18,31 +19,25 @@ warnings.filterwarnings('ignore')
 mlflow.set_tracking_uri("http://localhost:5000")
 mlflow.set_experiment("model_registry_demo")
 
+# Autolog records params, training metrics, the model and its signature on fit
+mlflow.sklearn.autolog(log_models=True, log_input_examples=False, log_model_signatures=True)
+
 # Load and prepare data
-iris = load_iris()
+iris = get_iris()
+X = iris.data.astype(np.float32)
+y = iris.target.astype(np.uint8)
 X_train, X_test, y_train, y_test = train_test_split(
-    iris.data, iris.target, test_size=0.2, random_state=42
+    X, y, test_size=0.2, random_state=42
 )
 
 # Train model
 with mlflow.start_run(run_name="production_ready_model"):
-    model = RandomForestClassifier(n_estimators=100, max_depth=10, random_state=42)
+    model = RandomForestClassifier(n_estimators=100, max_depth=10, random_state=42, n_jobs=-1)
     model.fit(X_train, y_train)
     
     accuracy = accuracy_score(y_test, model.predict(X_test))
     
-    mlflow.log_param("n_estimators", 100)
-    mlflow.log_param("max_depth", 10)
-    mlflow.log_metric("accuracy", accuracy)
-    
-    # Log model with input example to auto-infer signature
-    mlflow.sklearn.log_model(
-        model,
-        "model",
-        input_example=X_test[:5]  # Use first 5 test samples as input example
-    )
-    
-    # Get current run ID
+    # Get current run ID; autolog stored the model under "model"
     run_id = mlflow.active_run().info.run_id
     model_uri = f"runs:/{run_id}/model"
     